@@ -1,6 +1,7 @@
 #pragma once
 
 #include <juce_core/juce_core.h>
+#include <array>
 
 namespace DSP {
 
@@ -126,8 +127,21 @@ public:
 
     //==============================================================================
     // Parameter control
+    // The ID-based accessors resolve the ID with a linear scan of the parameter
+    // table, so keep them off the audio thread. Realtime callers should resolve
+    // the slot once with getParameterIndex() and use the slot-based setter.
     void setParameter(const juce::String& parameterID, float value);
     float getParameter(const juce::String& parameterID) const;
+    void setParameterAtIndex(int parameterIndex, float value);
+
+    // Slot of a parameter ID, or -1 if the ID is unknown (linear scan)
+    static int getParameterIndex(const juce::String& parameterID);
+
+    // Factory default for a parameter (0 if the ID is unknown)
+    static float getDefaultParameter(const juce::String& parameterID);
+
+    // Valid range and step for a parameter (default 0-1 range if the ID is unknown)
+    static juce::NormalisableRange<float> getParameterRange(const juce::String& parameterID);
 
     //==============================================================================
     // Preset management
@@ -159,15 +173,19 @@ private:
         float lfoPhase;
     };
 
-    juce::OwnedArray<Voice> voices;
-    int maxPolyphony = 64;
+    juce::Array<Voice> voices; // Contiguous pool, allocated once in prepare()
+    static constexpr int maxPolyphony = 64;
 
     //==============================================================================
-    // Parameter storage (normalized 0-1 range)
-    juce::HashMap<juce::String, float> parameters;
+    // Parameter storage: one fixed slot per engine parameter, in the order of
+    // the parameter table in ChoirV2PureDSP.cpp
+    static constexpr int numParameters = 34;
+    std::array<float, numParameters> parameters {};
 
-    // Active note tracking
-    juce::Array<int> activeNotes;
+    // Active note tracking. The minimum allocation of maxPolyphony
+    // stops removals from shrinking the storage, so once reserved in
+    // prepare() it is never reallocated on the audio thread
+    juce::Array<int, juce::DummyCriticalSection, maxPolyphony> activeNotes;
 
     // Current pitch bend (normalized -1 to 1)
     float currentPitchBend = 0.0f;
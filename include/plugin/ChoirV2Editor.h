@@ -41,6 +41,14 @@ public:
 private:
     void timerCallback() override;
 
+    // Builds a rotary knob attached to a parameter, with a centred label above it.
+    // The knob's range and step come from the parameter.
+    void setupRotarySlider(std::unique_ptr<juce::Slider>& slider,
+                           std::unique_ptr<juce::AudioProcessorValueTreeState::SliderAttachment>& attachment,
+                           std::unique_ptr<juce::Label>& label,
+                           const juce::String& parameterID,
+                           const juce::String& labelName, const juce::String& labelText);
+
     // UI Components - Master Section (4 controls)
     std::unique_ptr<juce::Slider> masterVolumeSlider;
     std::unique_ptr<juce::AudioProcessorValueTreeState::SliderAttachment> masterVolumeAttachment;
@@ -221,6 +229,10 @@ private:
     // Look and Feel
     std::unique_ptr<juce::LookAndFeel> lookAndFeel;
 
+    // Header fonts (built once rather than on every repaint)
+    juce::Font titleFont { 32.0f, juce::Font::bold };
+    juce::Font subtitleFont { 14.0f };
+
     ChoirV2Processor& processorRef;
 
     JUCE_DECLARE_NON_COPYABLE_WITH_LEAK_DETECTOR (ChoirV2Editor)
@@ -4,8 +4,7 @@
 #include "dsp/ChoirV2PureDSP.h"
 
 class ChoirV2Processor  : public juce::AudioProcessor,
-                            public juce::AudioProcessorValueTreeState::Listener,
-                            private juce::Timer
+                            public juce::AudioProcessorParameter::Listener
 {
 public:
     ChoirV2Processor();
@@ -42,7 +41,8 @@ public:
     void setStateInformation(const void* data, int sizeInBytes) override;
 
     //==============================================================================
-    void parameterChanged(const juce::String& parameterID, float newValue) override;
+    void parameterValueChanged(int parameterIndex, float newValue) override;
+    void parameterGestureChanged(int, bool) override {}
 
     //==============================================================================
     juce::AudioProcessorValueTreeState& getValueTreeState() { return parameters; }
@@ -56,13 +56,14 @@ private:
     // Create all parameters
     juce::AudioProcessorValueTreeState::ParameterLayout createParameterLayout();
 
-    // Timer callback for UI updates
-    void timerCallback() override;
-
     //==============================================================================
     DSP::ChoirV2PureDSP pureDSP_;
     juce::AudioProcessorValueTreeState parameters;
 
+    // PureDSP slot for each plugin parameter (by parameter index), resolved
+    // once at construction; -1 for parameters the engine doesn't store
+    std::vector<int> dspParameterSlots;
+
     // Lock-free queue for parameter changes from audio thread
     juce::AbstractFifo parameterUpdateQueue { 1024 };
 
@@ -3,44 +3,71 @@
 
 namespace DSP {
 
+//==============================================================================
+namespace {
+
+// Every engine parameter with its default value, valid range and step. This is the
+// canonical preset schema: the table order is also the slot order in
+// ChoirV2PureDSP::parameters, and defaults and ranges are shared with the
+// plugin's parameter layout via getDefaultParameter()/getParameterRange()
+struct ParameterSpec
+{
+    const char* id;
+    float defaultValue;
+    float minValue;
+    float maxValue;
+    float interval;
+};
+
+constexpr ParameterSpec parameterSpecs[] = {
+    // ID                                                    default min     max    step
+    { ChoirV2PureDSP::ParameterID::masterVolume,             0.8f,   0.0f,   1.0f,   0.001f },
+    { ChoirV2PureDSP::ParameterID::polyphony,                32.0f,  1.0f,   64.0f,  1.0f },
+    { ChoirV2PureDSP::ParameterID::vowelX,                   0.0f,   -1.0f,  1.0f,   0.01f },
+    { ChoirV2PureDSP::ParameterID::vowelY,                   0.0f,   -1.0f,  1.0f,   0.01f },
+    { ChoirV2PureDSP::ParameterID::vowelZ,                   0.0f,   -1.0f,  1.0f,   0.01f },
+    { ChoirV2PureDSP::ParameterID::formantScale,             1.0f,   0.5f,   2.0f,   0.01f },
+    { ChoirV2PureDSP::ParameterID::formantShift,             0.0f,   -12.0f, 12.0f,  0.1f },
+    { ChoirV2PureDSP::ParameterID::breathMix,                0.0f,   0.0f,   1.0f,   0.01f },
+    { ChoirV2PureDSP::ParameterID::breathColor,              0.5f,   0.0f,   1.0f,   0.01f },
+    { ChoirV2PureDSP::ParameterID::vibratoRate,              5.0f,   0.0f,   15.0f,  0.1f },
+    { ChoirV2PureDSP::ParameterID::vibratoDepth,             0.1f,   0.0f,   1.0f,   0.01f },
+    { ChoirV2PureDSP::ParameterID::vibratoDelay,             0.5f,   0.0f,   2.0f,   0.01f },
+    { ChoirV2PureDSP::ParameterID::tightness,                0.5f,   0.0f,   1.0f,   0.01f },
+    { ChoirV2PureDSP::ParameterID::ensembleSize,             32.0f,  1.0f,   100.0f, 1.0f },
+    { ChoirV2PureDSP::ParameterID::voiceSpread,              0.3f,   0.0f,   1.0f,   0.01f },
+    { ChoirV2PureDSP::ParameterID::attack,                   0.05f,  0.001f, 2.0f,   0.001f },
+    { ChoirV2PureDSP::ParameterID::decay,                    0.2f,   0.001f, 2.0f,   0.001f },
+    { ChoirV2PureDSP::ParameterID::sustain,                  0.7f,   0.0f,   1.0f,   0.01f },
+    { ChoirV2PureDSP::ParameterID::release,                  0.3f,   0.01f,  5.0f,   0.01f },
+    { ChoirV2PureDSP::ParameterID::sopranoLevel,             0.8f,   0.0f,   1.0f,   0.01f },
+    { ChoirV2PureDSP::ParameterID::altoLevel,                0.8f,   0.0f,   1.0f,   0.01f },
+    { ChoirV2PureDSP::ParameterID::tenorLevel,               0.8f,   0.0f,   1.0f,   0.01f },
+    { ChoirV2PureDSP::ParameterID::bassLevel,                0.8f,   0.0f,   1.0f,   0.01f },
+    { ChoirV2PureDSP::ParameterID::reverbMix,                0.3f,   0.0f,   1.0f,   0.01f },
+    { ChoirV2PureDSP::ParameterID::reverbDecay,              2.5f,   0.1f,   10.0f,  0.1f },
+    { ChoirV2PureDSP::ParameterID::reverbPredelay,           0.02f,  0.0f,   0.1f,   0.001f },
+    { ChoirV2PureDSP::ParameterID::spectralEnhancement,      0.5f,   0.0f,   1.0f,   0.01f },
+    { ChoirV2PureDSP::ParameterID::harmonicsBoost,           0.3f,   0.0f,   1.0f,   0.01f },
+    { ChoirV2PureDSP::ParameterID::subharmonicMix,           0.0f,   0.0f,   1.0f,   0.01f },
+    { ChoirV2PureDSP::ParameterID::subharmonicDepth,         0.5f,   0.0f,   1.0f,   0.01f },
+    { ChoirV2PureDSP::ParameterID::subharmonicRatio,         1.0f,   0.5f,   2.0f,   0.01f },
+    { ChoirV2PureDSP::ParameterID::diphoneCrossfadeDuration, 0.1f,   0.01f,  0.5f,   0.01f },
+    { ChoirV2PureDSP::ParameterID::diphoneFormantSmoothing,  0.5f,   0.0f,   1.0f,   0.01f },
+    { ChoirV2PureDSP::ParameterID::synthesisMethod,          0.0f,   0.0f,   3.0f,   1.0f },
+};
+
+} // namespace
+
 //==============================================================================
 ChoirV2PureDSP::ChoirV2PureDSP()
 {
+    static_assert(std::size(parameterSpecs) == numParameters,
+                  "Every parameter needs a default");
+
     // Initialize default parameters
-    parameters.set(juce::String(ParameterID::masterVolume), 0.8f);
-    parameters.set(juce::String(ParameterID::polyphony), 32.0f);
-    parameters.set(juce::String(ParameterID::vowelX), 0.0f);
-    parameters.set(juce::String(ParameterID::vowelY), 0.0f);
-    parameters.set(juce::String(ParameterID::vowelZ), 0.0f);
-    parameters.set(juce::String(ParameterID::formantScale), 1.0f);
-    parameters.set(juce::String(ParameterID::formantShift), 0.0f);
-    parameters.set(juce::String(ParameterID::breathMix), 0.0f);
-    parameters.set(juce::String(ParameterID::breathColor), 0.5f);
-    parameters.set(juce::String(ParameterID::vibratoRate), 5.0f);
-    parameters.set(juce::String(ParameterID::vibratoDepth), 0.1f);
-    parameters.set(juce::String(ParameterID::vibratoDelay), 0.5f);
-    parameters.set(juce::String(ParameterID::tightness), 0.5f);
-    parameters.set(juce::String(ParameterID::ensembleSize), 32.0f);
-    parameters.set(juce::String(ParameterID::voiceSpread), 0.3f);
-    parameters.set(juce::String(ParameterID::attack), 0.05f);
-    parameters.set(juce::String(ParameterID::decay), 0.2f);
-    parameters.set(juce::String(ParameterID::sustain), 0.7f);
-    parameters.set(juce::String(ParameterID::release), 0.3f);
-    parameters.set(juce::String(ParameterID::sopranoLevel), 0.8f);
-    parameters.set(juce::String(ParameterID::altoLevel), 0.8f);
-    parameters.set(juce::String(ParameterID::tenorLevel), 0.8f);
-    parameters.set(juce::String(ParameterID::bassLevel), 0.8f);
-    parameters.set(juce::String(ParameterID::reverbMix), 0.3f);
-    parameters.set(juce::String(ParameterID::reverbDecay), 2.5f);
-    parameters.set(juce::String(ParameterID::reverbPredelay), 0.02f);
-    parameters.set(juce::String(ParameterID::spectralEnhancement), 0.5f);
-    parameters.set(juce::String(ParameterID::harmonicsBoost), 0.3f);
-    parameters.set(juce::String(ParameterID::subharmonicMix), 0.0f);
-    parameters.set(juce::String(ParameterID::subharmonicDepth), 0.5f);
-    parameters.set(juce::String(ParameterID::subharmonicRatio), 1.0f);
-    parameters.set(juce::String(ParameterID::diphoneCrossfadeDuration), 0.1f);
-    parameters.set(juce::String(ParameterID::diphoneFormantSmoothing), 0.5f);
-    parameters.set(juce::String(ParameterID::synthesisMethod), 0.0f);
+    for (size_t i = 0; i < parameters.size(); ++i)
+        parameters[i] = parameterSpecs[i].defaultValue;
 }
 
 ChoirV2PureDSP::~ChoirV2PureDSP()
@@ -54,34 +81,29 @@ void ChoirV2PureDSP::prepare(double newSampleRate, int newSamplesPerBlock)
     sampleRate = newSampleRate;
     samplesPerBlock = newSamplesPerBlock;
 
-    // Initialize voice pool
-    voices.clear();
-    for (int i = 0; i < maxPolyphony; ++i)
-    {
-        auto* voice = new Voice();
-        voice->active = false;
-        voice->noteNumber = -1;
-        voice->velocity = 0.0f;
-        voice->age = 0.0f;
-        voice->lfoPhase = 0.0f;
-        for (int j = 0; j < 4; ++j)
-            voice->phase[j] = 0.0f;
-
-        voices.add(voice);
-    }
+    // Initialize voice pool in a single allocation (elements are zeroed)
+    voices.clearQuick();
+    voices.resize(maxPolyphony);
+
+    for (auto& voice : voices)
+        voice.noteNumber = -1;
+
+    // Reserve note tracking up front so note-ons never reallocate on the
+    // audio thread
+    activeNotes.ensureStorageAllocated(maxPolyphony);
 }
 
 void ChoirV2PureDSP::reset()
 {
-    activeNotes.clear();
+    activeNotes.clearQuick(); // Keep the storage reserved in prepare()
     currentPitchBend = 0.0f;
     currentAftertouch = 0.0f;
 
-    for (auto* voice : voices)
+    for (auto& voice : voices)
     {
-        voice->active = false;
-        voice->noteNumber = -1;
-        voice->age = 0.0f;
+        voice.active = false;
+        voice.noteNumber = -1;
+        voice.age = 0.0f;
     }
 }
 
@@ -125,29 +147,77 @@ void ChoirV2PureDSP::handleEvent(const ScheduledEvent& event)
 //==============================================================================
 void ChoirV2PureDSP::setParameter(const juce::String& parameterID, float value)
 {
-    parameters.set(parameterID, value);
+    // Unknown IDs are ignored rather than growing the parameter set
+    setParameterAtIndex(getParameterIndex(parameterID), value);
+}
+
+void ChoirV2PureDSP::setParameterAtIndex(int parameterIndex, float value)
+{
+    if (parameterIndex >= 0 && parameterIndex < numParameters)
+        parameters[(size_t) parameterIndex] = value;
 }
 
 float ChoirV2PureDSP::getParameter(const juce::String& parameterID) const
 {
-    return parameters.getParameter(parameterID, 0.0f);
+    const int index = getParameterIndex(parameterID);
+    return index >= 0 ? parameters[(size_t) index] : 0.0f;
+}
+
+float ChoirV2PureDSP::getDefaultParameter(const juce::String& parameterID)
+{
+    const int index = getParameterIndex(parameterID);
+    return index >= 0 ? parameterSpecs[index].defaultValue : 0.0f;
+}
+
+juce::NormalisableRange<float> ChoirV2PureDSP::getParameterRange(const juce::String& parameterID)
+{
+    const int index = getParameterIndex(parameterID);
+    if (index < 0)
+        return {};
+
+    const auto& spec = parameterSpecs[index];
+    return { spec.minValue, spec.maxValue, spec.interval };
+}
+
+int ChoirV2PureDSP::getParameterIndex(const juce::String& parameterID)
+{
+    for (int i = 0; i < numParameters; ++i)
+        if (parameterID == parameterSpecs[i].id)
+            return i;
+
+    return -1;
 }
 
 //==============================================================================
 juce::String ChoirV2PureDSP::savePreset() const
 {
-    // Create JSON object with all parameters
-    juce::DynamicObject::Ptr json = new juce::DynamicObject();
-
-    // Add all parameters
-    for (juce::HashMap<juce::String, float>::Iterator it(parameters);
-         it.next();)
+    // Write parameters straight to the stream rather than building a
+    // DynamicObject/var tree just to hand it to the generic JSON writer.
+    // The preset only lives inside the plugin state, so it is written
+    // compactly with no indentation or line breaks. The buffer is sized up
+    // front (~40 bytes per "name":value entry) so it doesn't regrow.
+    juce::MemoryOutputStream out (parameters.size() * 40);
+    out << '{';
+
+    for (size_t i = 0; i < parameters.size(); ++i)
     {
-        json->setProperty(it.getKey(), it.getValue());
+        if (i > 0)
+            out << ',';
+
+        // IDs are fixed identifiers, so they need no JSON escaping
+        const float value = parameters[i];
+        out << '"' << parameterSpecs[i].id << "\":";
+
+        // Match juce::JSON: numbers go through its double serialiser at
+        // round-trip precision, and non-finite numbers are written as null
+        if (std::isfinite(value))
+            out << juce::var((double) value).toString();
+        else
+            out << "null";
     }
 
-    // Convert to JSON string
-    return juce::JSON::toString(juce::var(json));
+    out << '}';
+    return out.toString();
 }
 
 bool ChoirV2PureDSP::loadPreset(const juce::String& presetJson)
@@ -162,13 +232,20 @@ bool ChoirV2PureDSP::loadPreset(const juce::String& presetJson)
     if (obj == nullptr)
         return false;
 
-    // Load all parameters
-    for (int i = 0; i < obj->getProperties().size(); ++i)
+    // Load all known parameters, validated against the schema table: entries
+    // with unknown IDs or non-numeric values are skipped and values are
+    // clamped to the parameter's range
+    const auto& properties = obj->getProperties();
+    for (int i = 0; i < properties.size(); ++i)
     {
-        auto name = obj->getProperties().getName(i).toString();
-        auto value = (float)obj->getProperties().getValueAt(i);
+        const int index = getParameterIndex(properties.getName(i).toString());
+        const auto& value = properties.getValueAt(i);
+
+        if (index < 0 || !(value.isDouble() || value.isInt() || value.isInt64()))
+            continue;
 
-        parameters.set(name, value);
+        const auto& spec = parameterSpecs[index];
+        parameters[(size_t) index] = juce::jlimit(spec.minValue, spec.maxValue, (float)value);
     }
 
     return true;
@@ -200,14 +277,14 @@ void ChoirV2PureDSP::processStereo(juce::AudioBuffer<float>& buffer)
 void ChoirV2PureDSP::processNoteOn(int noteNumber, float velocity)
 {
     // Find free voice
-    for (auto* voice : voices)
+    for (auto& voice : voices)
     {
-        if (!voice->active)
+        if (!voice.active)
         {
-            voice->active = true;
-            voice->noteNumber = noteNumber;
-            voice->velocity = velocity;
-            voice->age = 0.0f;
+            voice.active = true;
+            voice.noteNumber = noteNumber;
+            voice.velocity = velocity;
+            voice.age = 0.0f;
 
             activeNotes.addIfNotAlreadyThere(noteNumber);
             break;
@@ -218,12 +295,12 @@ void ChoirV2PureDSP::processNoteOn(int noteNumber, float velocity)
 void ChoirV2PureDSP::processNoteOff(int noteNumber)
 {
     // Find voice and deactivate
-    for (auto* voice : voices)
+    for (auto& voice : voices)
     {
-        if (voice->active && voice->noteNumber == noteNumber)
+        if (voice.active && voice.noteNumber == noteNumber)
         {
-            voice->active = false;
-            voice->noteNumber = -1;
+            voice.active = false;
+            voice.noteNumber = -1;
             break;
         }
     }
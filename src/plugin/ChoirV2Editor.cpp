@@ -1,5 +1,19 @@
 #include "ChoirV2Editor.h"
 
+//==============================================================================
+namespace Palette
+{
+    // Dark theme colours, shared by the look-and-feel and the editor
+    const juce::Colour background (30, 30, 35);
+    const juce::Colour control (45, 45, 50);
+    const juce::Colour track (70, 70, 80);
+    const juce::Colour groupOutline (60, 60, 70);
+    const juce::Colour accent (100, 150, 200);
+    const juce::Colour text (220, 220, 220);
+    const juce::Colour groupText (180, 180, 180);
+    const juce::Colour phoneme (100, 200, 150);
+}
+
 //==============================================================================
 class ChoirV2LookAndFeel : public juce::LookAndFeel_V4
 {
@@ -7,19 +21,19 @@ public:
     ChoirV2LookAndFeel()
     {
         // Dark theme colors
-        setColour(juce::ResizableWindow::backgroundColourId, juce::Colour(30, 30, 35));
-        setColour(juce::Slider::backgroundColourId, juce::Colour(45, 45, 50));
-        setColour(juce::Slider::trackColourId, juce::Colour(70, 70, 80));
-        setColour(juce::Slider::thumbColourId, juce::Colour(100, 150, 200));
-        setColour(juce::Slider::rotarySliderFillColourId, juce::Colour(100, 150, 200));
-        setColour(juce::Label::textColourId, juce::Colour(220, 220, 220));
-        setColour(juce::Label::backgroundColourId, juce::Colour(30, 30, 35));
-        setColour(juce::GroupComponent::textColourId, juce::Colour(180, 180, 180));
-        setColour(juce::GroupComponent::outlineColourId, juce::Colour(60, 60, 70));
-        setColour(juce::ComboBox::backgroundColourId, juce::Colour(45, 45, 50));
-        setColour(juce::ComboBox::textColourId, juce::Colour(220, 220, 220));
-        setColour(juce::TextButton::buttonColourId, juce::Colour(70, 70, 80));
-        setColour(juce::TextButton::textColourOnId, juce::Colour(220, 220, 220));
+        setColour(juce::ResizableWindow::backgroundColourId, Palette::background);
+        setColour(juce::Slider::backgroundColourId, Palette::control);
+        setColour(juce::Slider::trackColourId, Palette::track);
+        setColour(juce::Slider::thumbColourId, Palette::accent);
+        setColour(juce::Slider::rotarySliderFillColourId, Palette::accent);
+        setColour(juce::Label::textColourId, Palette::text);
+        setColour(juce::Label::backgroundColourId, Palette::background);
+        setColour(juce::GroupComponent::textColourId, Palette::groupText);
+        setColour(juce::GroupComponent::outlineColourId, Palette::groupOutline);
+        setColour(juce::ComboBox::backgroundColourId, Palette::control);
+        setColour(juce::ComboBox::textColourId, Palette::text);
+        setColour(juce::TextButton::buttonColourId, Palette::track);
+        setColour(juce::TextButton::textColourOnId, Palette::text);
     }
 };
 
@@ -44,28 +58,12 @@ ChoirV2Editor::ChoirV2Editor(ChoirV2Processor& p)
     addAndMakeVisible(*masterGroup);
 
     // Master Volume
-    masterVolumeSlider = std::make_unique<juce::Slider>(juce::Slider::RotaryHorizontalVerticalDrag, juce::Slider::TextBoxBelow);
-    masterVolumeSlider->setRange(0.0, 1.0, 0.001);
-    masterVolumeAttachment = std::make_unique<juce::AudioProcessorValueTreeState::SliderAttachment>(
-        params, ChoirV2Processor::MASTER_VOLUME_PARAM, *masterVolumeSlider);
-    addAndMakeVisible(*masterVolumeSlider);
-
-    masterVolumeLabel = std::make_unique<juce::Label>("MasterVolumeLabel", "Volume");
-    masterVolumeLabel->attachToComponent(masterVolumeSlider.get(), false);
-    masterVolumeLabel->setJustification(juce::Justification::centred);
-    addAndMakeVisible(*masterVolumeLabel);
+    setupRotarySlider(masterVolumeSlider, masterVolumeAttachment, masterVolumeLabel, ChoirV2Processor::MASTER_VOLUME_PARAM,
+                      "MasterVolumeLabel", "Volume");
 
     // Polyphony
-    polyphonySlider = std::make_unique<juce::Slider>(juce::Slider::RotaryHorizontalVerticalDrag, juce::Slider::TextBoxBelow);
-    polyphonySlider->setRange(1.0, 64.0, 1.0);
-    polyphonyAttachment = std::make_unique<juce::AudioProcessorValueTreeState::SliderAttachment>(
-        params, ChoirV2Processor::POLYPHONY_PARAM, *polyphonySlider);
-    addAndMakeVisible(*polyphonySlider);
-
-    polyphonyLabel = std::make_unique<juce::Label>("PolyphonyLabel", "Voices");
-    polyphonyLabel->attachToComponent(polyphonySlider.get(), false);
-    polyphonyLabel->setJustification(juce::Justification::centred);
-    addAndMakeVisible(*polyphonyLabel);
+    setupRotarySlider(polyphonySlider, polyphonyAttachment, polyphonyLabel, ChoirV2Processor::POLYPHONY_PARAM,
+                      "PolyphonyLabel", "Voices");
 
     // Text Input
     textInputLabel = std::make_unique<juce::Label>("TextInputLabel", "Text:");
@@ -87,7 +85,7 @@ ChoirV2Editor::ChoirV2Editor(ChoirV2Processor& p)
     phonemeDisplayValue = std::make_unique<juce::Label>("PhonemeDisplayValue", "AH");
     phonemeDisplayValue->setFont(juce::Font(24.0f, juce::Font::bold));
     phonemeDisplayValue->setJustification(juce::Justification::centred);
-    phonemeDisplayValue->setColour(juce::Label::textColourId, juce::Colour(100, 200, 150));
+    phonemeDisplayValue->setColour(juce::Label::textColourId, Palette::phoneme);
     addAndMakeVisible(*phonemeDisplayValue);
 
     //==========================================================================
@@ -97,7 +95,6 @@ ChoirV2Editor::ChoirV2Editor(ChoirV2Processor& p)
     addAndMakeVisible(*vowelGroup);
 
     vowelXSlider = std::make_unique<juce::Slider>(juce::Slider::LinearHorizontal, juce::Slider::TextBoxRight);
-    vowelXSlider->setRange(-1.0, 1.0, 0.01);
     vowelXAttachment = std::make_unique<juce::AudioProcessorValueTreeState::SliderAttachment>(
         params, ChoirV2Processor::VOWEL_X_PARAM, *vowelXSlider);
     addAndMakeVisible(*vowelXSlider);
@@ -107,7 +104,6 @@ ChoirV2Editor::ChoirV2Editor(ChoirV2Processor& p)
     addAndMakeVisible(*vowelXLabel);
 
     vowelYSlider = std::make_unique<juce::Slider>(juce::Slider::LinearHorizontal, juce::Slider::TextBoxRight);
-    vowelYSlider->setRange(-1.0, 1.0, 0.01);
     vowelYAttachment = std::make_unique<juce::AudioProcessorValueTreeState::SliderAttachment>(
         params, ChoirV2Processor::VOWEL_Y_PARAM, *vowelYSlider);
     addAndMakeVisible(*vowelYSlider);
@@ -117,7 +113,6 @@ ChoirV2Editor::ChoirV2Editor(ChoirV2Processor& p)
     addAndMakeVisible(*vowelYLabel);
 
     vowelZSlider = std::make_unique<juce::Slider>(juce::Slider::LinearHorizontal, juce::Slider::TextBoxRight);
-    vowelZSlider->setRange(-1.0, 1.0, 0.01);
     vowelZAttachment = std::make_unique<juce::AudioProcessorValueTreeState::SliderAttachment>(
         params, ChoirV2Processor::VOWEL_Z_PARAM, *vowelZSlider);
     addAndMakeVisible(*vowelZSlider);
@@ -132,27 +127,11 @@ ChoirV2Editor::ChoirV2Editor(ChoirV2Processor& p)
     formantGroup = std::make_unique<juce::GroupComponent>("FormantGroup", "FORMANTS");
     addAndMakeVisible(*formantGroup);
 
-    formantScaleSlider = std::make_unique<juce::Slider>(juce::Slider::RotaryHorizontalVerticalDrag, juce::Slider::TextBoxBelow);
-    formantScaleSlider->setRange(0.5, 2.0, 0.01);
-    formantScaleAttachment = std::make_unique<juce::AudioProcessorValueTreeState::SliderAttachment>(
-        params, ChoirV2Processor::FORMANT_SCALE_PARAM, *formantScaleSlider);
-    addAndMakeVisible(*formantScaleSlider);
-
-    formantScaleLabel = std::make_unique<juce::Label>("FormantScaleLabel", "Scale");
-    formantScaleLabel->attachToComponent(formantScaleSlider.get(), false);
-    formantScaleLabel->setJustification(juce::Justification::centred);
-    addAndMakeVisible(*formantScaleLabel);
+    setupRotarySlider(formantScaleSlider, formantScaleAttachment, formantScaleLabel, ChoirV2Processor::FORMANT_SCALE_PARAM,
+                      "FormantScaleLabel", "Scale");
 
-    formantShiftSlider = std::make_unique<juce::Slider>(juce::Slider::RotaryHorizontalVerticalDrag, juce::Slider::TextBoxBelow);
-    formantShiftSlider->setRange(-12.0, 12.0, 0.1);
-    formantShiftAttachment = std::make_unique<juce::AudioProcessorValueTreeState::SliderAttachment>(
-        params, ChoirV2Processor::FORMANT_SHIFT_PARAM, *formantShiftSlider);
-    addAndMakeVisible(*formantShiftSlider);
-
-    formantShiftLabel = std::make_unique<juce::Label>("FormantShiftLabel", "Shift");
-    formantShiftLabel->attachToComponent(formantShiftSlider.get(), false);
-    formantShiftLabel->setJustification(juce::Justification::centred);
-    addAndMakeVisible(*formantShiftLabel);
+    setupRotarySlider(formantShiftSlider, formantShiftAttachment, formantShiftLabel, ChoirV2Processor::FORMANT_SHIFT_PARAM,
+                      "FormantShiftLabel", "Shift");
 
     //==========================================================================
     // BREATH
@@ -160,27 +139,11 @@ ChoirV2Editor::ChoirV2Editor(ChoirV2Processor& p)
     breathGroup = std::make_unique<juce::GroupComponent>("BreathGroup", "BREATH");
     addAndMakeVisible(*breathGroup);
 
-    breathMixSlider = std::make_unique<juce::Slider>(juce::Slider::RotaryHorizontalVerticalDrag, juce::Slider::TextBoxBelow);
-    breathMixSlider->setRange(0.0, 1.0, 0.01);
-    breathMixAttachment = std::make_unique<juce::AudioProcessorValueTreeState::SliderAttachment>(
-        params, ChoirV2Processor::BREATH_MIX_PARAM, *breathMixSlider);
-    addAndMakeVisible(*breathMixSlider);
-
-    breathMixLabel = std::make_unique<juce::Label>("BreathMixLabel", "Mix");
-    breathMixLabel->attachToComponent(breathMixSlider.get(), false);
-    breathMixLabel->setJustification(juce::Justification::centred);
-    addAndMakeVisible(*breathMixLabel);
+    setupRotarySlider(breathMixSlider, breathMixAttachment, breathMixLabel, ChoirV2Processor::BREATH_MIX_PARAM,
+                      "BreathMixLabel", "Mix");
 
-    breathColorSlider = std::make_unique<juce::Slider>(juce::Slider::RotaryHorizontalVerticalDrag, juce::Slider::TextBoxBelow);
-    breathColorSlider->setRange(0.0, 1.0, 0.01);
-    breathColorAttachment = std::make_unique<juce::AudioProcessorValueTreeState::SliderAttachment>(
-        params, ChoirV2Processor::BREATH_COLOR_PARAM, *breathColorSlider);
-    addAndMakeVisible(*breathColorSlider);
-
-    breathColorLabel = std::make_unique<juce::Label>("BreathColorLabel", "Color");
-    breathColorLabel->attachToComponent(breathColorSlider.get(), false);
-    breathColorLabel->setJustification(juce::Justification::centred);
-    addAndMakeVisible(*breathColorLabel);
+    setupRotarySlider(breathColorSlider, breathColorAttachment, breathColorLabel, ChoirV2Processor::BREATH_COLOR_PARAM,
+                      "BreathColorLabel", "Color");
 
     //==========================================================================
     // VIBRATO
@@ -188,38 +151,14 @@ ChoirV2Editor::ChoirV2Editor(ChoirV2Processor& p)
     vibratoGroup = std::make_unique<juce::GroupComponent>("VibratoGroup", "VIBRATO");
     addAndMakeVisible(*vibratoGroup);
 
-    vibratoRateSlider = std::make_unique<juce::Slider>(juce::Slider::RotaryHorizontalVerticalDrag, juce::Slider::TextBoxBelow);
-    vibratoRateSlider->setRange(0.0, 10.0, 0.1);
-    vibratoRateAttachment = std::make_unique<juce::AudioProcessorValueTreeState::SliderAttachment>(
-        params, ChoirV2Processor::VIBRATO_RATE_PARAM, *vibratoRateSlider);
-    addAndMakeVisible(*vibratoRateSlider);
-
-    vibratoRateLabel = std::make_unique<juce::Label>("VibratoRateLabel", "Rate");
-    vibratoRateLabel->attachToComponent(vibratoRateSlider.get(), false);
-    vibratoRateLabel->setJustification(juce::Justification::centred);
-    addAndMakeVisible(*vibratoRateLabel);
-
-    vibratoDepthSlider = std::make_unique<juce::Slider>(juce::Slider::RotaryHorizontalVerticalDrag, juce::Slider::TextBoxBelow);
-    vibratoDepthSlider->setRange(0.0, 1.0, 0.01);
-    vibratoDepthAttachment = std::make_unique<juce::AudioProcessorValueTreeState::SliderAttachment>(
-        params, ChoirV2Processor::VIBRATO_DEPTH_PARAM, *vibratoDepthSlider);
-    addAndMakeVisible(*vibratoDepthSlider);
-
-    vibratoDepthLabel = std::make_unique<juce::Label>("VibratoDepthLabel", "Depth");
-    vibratoDepthLabel->attachToComponent(vibratoDepthSlider.get(), false);
-    vibratoDepthLabel->setJustification(juce::Justification::centred);
-    addAndMakeVisible(*vibratoDepthLabel);
-
-    vibratoDelaySlider = std::make_unique<juce::Slider>(juce::Slider::RotaryHorizontalVerticalDrag, juce::Slider::TextBoxBelow);
-    vibratoDelaySlider->setRange(0.0, 1.0, 0.01);
-    vibratoDelayAttachment = std::make_unique<juce::AudioProcessorValueTreeState::SliderAttachment>(
-        params, ChoirV2Processor::VIBRATO_DELAY_PARAM, *vibratoDelaySlider);
-    addAndMakeVisible(*vibratoDelaySlider);
-
-    vibratoDelayLabel = std::make_unique<juce::Label>("VibratoDelayLabel", "Delay");
-    vibratoDelayLabel->attachToComponent(vibratoDelaySlider.get(), false);
-    vibratoDelayLabel->setJustification(juce::Justification::centred);
-    addAndMakeVisible(*vibratoDelayLabel);
+    setupRotarySlider(vibratoRateSlider, vibratoRateAttachment, vibratoRateLabel, ChoirV2Processor::VIBRATO_RATE_PARAM,
+                      "VibratoRateLabel", "Rate");
+
+    setupRotarySlider(vibratoDepthSlider, vibratoDepthAttachment, vibratoDepthLabel, ChoirV2Processor::VIBRATO_DEPTH_PARAM,
+                      "VibratoDepthLabel", "Depth");
+
+    setupRotarySlider(vibratoDelaySlider, vibratoDelayAttachment, vibratoDelayLabel, ChoirV2Processor::VIBRATO_DELAY_PARAM,
+                      "VibratoDelayLabel", "Delay");
 
     //==========================================================================
     // ENSEMBLE
@@ -227,38 +166,14 @@ ChoirV2Editor::ChoirV2Editor(ChoirV2Processor& p)
     ensembleGroup = std::make_unique<juce::GroupComponent>("EnsembleGroup", "ENSEMBLE");
     addAndMakeVisible(*ensembleGroup);
 
-    tightnessSlider = std::make_unique<juce::Slider>(juce::Slider::RotaryHorizontalVerticalDrag, juce::Slider::TextBoxBelow);
-    tightnessSlider->setRange(0.0, 1.0, 0.01);
-    tightnessAttachment = std::make_unique<juce::AudioProcessorValueTreeState::SliderAttachment>(
-        params, ChoirV2Processor::TIGHTNESS_PARAM, *tightnessSlider);
-    addAndMakeVisible(*tightnessSlider);
-
-    tightnessLabel = std::make_unique<juce::Label>("TightnessLabel", "Tightness");
-    tightnessLabel->attachToComponent(tightnessSlider.get(), false);
-    tightnessLabel->setJustification(juce::Justification::centred);
-    addAndMakeVisible(*tightnessLabel);
-
-    ensembleSizeSlider = std::make_unique<juce::Slider>(juce::Slider::RotaryHorizontalVerticalDrag, juce::Slider::TextBoxBelow);
-    ensembleSizeSlider->setRange(1.0, 32.0, 1.0);
-    ensembleSizeAttachment = std::make_unique<juce::AudioProcessorValueTreeState::SliderAttachment>(
-        params, ChoirV2Processor::ENSEMBLE_SIZE_PARAM, *ensembleSizeSlider);
-    addAndMakeVisible(*ensembleSizeSlider);
-
-    ensembleSizeLabel = std::make_unique<juce::Label>("EnsembleSizeLabel", "Size");
-    ensembleSizeLabel->attachToComponent(ensembleSizeSlider.get(), false);
-    ensembleSizeLabel->setJustification(juce::Justification::centred);
-    addAndMakeVisible(*ensembleSizeLabel);
-
-    voiceSpreadSlider = std::make_unique<juce::Slider>(juce::Slider::RotaryHorizontalVerticalDrag, juce::Slider::TextBoxBelow);
-    voiceSpreadSlider->setRange(0.0, 1.0, 0.01);
-    voiceSpreadAttachment = std::make_unique<juce::AudioProcessorValueTreeState::SliderAttachment>(
-        params, ChoirV2Processor::VOICE_SPREAD_PARAM, *voiceSpreadSlider);
-    addAndMakeVisible(*voiceSpreadSlider);
-
-    voiceSpreadLabel = std::make_unique<juce::Label>("VoiceSpreadLabel", "Spread");
-    voiceSpreadLabel->attachToComponent(voiceSpreadSlider.get(), false);
-    voiceSpreadLabel->setJustification(juce::Justification::centred);
-    addAndMakeVisible(*voiceSpreadLabel);
+    setupRotarySlider(tightnessSlider, tightnessAttachment, tightnessLabel, ChoirV2Processor::TIGHTNESS_PARAM,
+                      "TightnessLabel", "Tightness");
+
+    setupRotarySlider(ensembleSizeSlider, ensembleSizeAttachment, ensembleSizeLabel, ChoirV2Processor::ENSEMBLE_SIZE_PARAM,
+                      "EnsembleSizeLabel", "Size");
+
+    setupRotarySlider(voiceSpreadSlider, voiceSpreadAttachment, voiceSpreadLabel, ChoirV2Processor::VOICE_SPREAD_PARAM,
+                      "VoiceSpreadLabel", "Spread");
 
     //==========================================================================
     // ADSR ENVELOPE
@@ -266,49 +181,17 @@ ChoirV2Editor::ChoirV2Editor(ChoirV2Processor& p)
     adsrGroup = std::make_unique<juce::GroupComponent>("ADSRGroup", "ENVELOPE");
     addAndMakeVisible(*adsrGroup);
 
-    attackSlider = std::make_unique<juce::Slider>(juce::Slider::RotaryHorizontalVerticalDrag, juce::Slider::TextBoxBelow);
-    attackSlider->setRange(0.0, 2.0, 0.01);
-    attackAttachment = std::make_unique<juce::AudioProcessorValueTreeState::SliderAttachment>(
-        params, ChoirV2Processor::ATTACK_PARAM, *attackSlider);
-    addAndMakeVisible(*attackSlider);
-
-    attackLabel = std::make_unique<juce::Label>("AttackLabel", "A");
-    attackLabel->attachToComponent(attackSlider.get(), false);
-    attackLabel->setJustification(juce::Justification::centred);
-    addAndMakeVisible(*attackLabel);
-
-    decaySlider = std::make_unique<juce::Slider>(juce::Slider::RotaryHorizontalVerticalDrag, juce::Slider::TextBoxBelow);
-    decaySlider->setRange(0.0, 2.0, 0.01);
-    decayAttachment = std::make_unique<juce::AudioProcessorValueTreeState::SliderAttachment>(
-        params, ChoirV2Processor::DECAY_PARAM, *decaySlider);
-    addAndMakeVisible(*decaySlider);
-
-    decayLabel = std::make_unique<juce::Label>("DecayLabel", "D");
-    decayLabel->attachToComponent(decaySlider.get(), false);
-    decayLabel->setJustification(juce::Justification::centred);
-    addAndMakeVisible(*decayLabel);
-
-    sustainSlider = std::make_unique<juce::Slider>(juce::Slider::RotaryHorizontalVerticalDrag, juce::Slider::TextBoxBelow);
-    sustainSlider->setRange(0.0, 1.0, 0.01);
-    sustainAttachment = std::make_unique<juce::AudioProcessorValueTreeState::SliderAttachment>(
-        params, ChoirV2Processor::SUSTAIN_PARAM, *sustainSlider);
-    addAndMakeVisible(*sustainSlider);
-
-    sustainLabel = std::make_unique<juce::Label>("SustainLabel", "S");
-    sustainLabel->attachToComponent(sustainSlider.get(), false);
-    sustainLabel->setJustification(juce::Justification::centred);
-    addAndMakeVisible(*sustainLabel);
-
-    releaseSlider = std::make_unique<juce::Slider>(juce::Slider::RotaryHorizontalVerticalDrag, juce::Slider::TextBoxBelow);
-    releaseSlider->setRange(0.01, 5.0, 0.01);
-    releaseAttachment = std::make_unique<juce::AudioProcessorValueTreeState::SliderAttachment>(
-        params, ChoirV2Processor::RELEASE_PARAM, *releaseSlider);
-    addAndMakeVisible(*releaseSlider);
-
-    releaseLabel = std::make_unique<juce::Label>("ReleaseLabel", "R");
-    releaseLabel->attachToComponent(releaseSlider.get(), false);
-    releaseLabel->setJustification(juce::Justification::centred);
-    addAndMakeVisible(*releaseLabel);
+    setupRotarySlider(attackSlider, attackAttachment, attackLabel, ChoirV2Processor::ATTACK_PARAM,
+                      "AttackLabel", "A");
+
+    setupRotarySlider(decaySlider, decayAttachment, decayLabel, ChoirV2Processor::DECAY_PARAM,
+                      "DecayLabel", "D");
+
+    setupRotarySlider(sustainSlider, sustainAttachment, sustainLabel, ChoirV2Processor::SUSTAIN_PARAM,
+                      "SustainLabel", "S");
+
+    setupRotarySlider(releaseSlider, releaseAttachment, releaseLabel, ChoirV2Processor::RELEASE_PARAM,
+                      "ReleaseLabel", "R");
 
     //==========================================================================
     // SATB BLEND
@@ -317,7 +200,6 @@ ChoirV2Editor::ChoirV2Editor(ChoirV2Processor& p)
     addAndMakeVisible(*satbGroup);
 
     sopranoLevelSlider = std::make_unique<juce::Slider>(juce::Slider::LinearVertical, juce::Slider::TextBoxBelow);
-    sopranoLevelSlider->setRange(0.0, 1.0, 0.01);
     sopranoLevelAttachment = std::make_unique<juce::AudioProcessorValueTreeState::SliderAttachment>(
         params, ChoirV2Processor::SOPRANO_LEVEL_PARAM, *sopranoLevelSlider);
     addAndMakeVisible(*sopranoLevelSlider);
@@ -328,7 +210,6 @@ ChoirV2Editor::ChoirV2Editor(ChoirV2Processor& p)
     addAndMakeVisible(*sopranoLevelLabel);
 
     altoLevelSlider = std::make_unique<juce::Slider>(juce::Slider::LinearVertical, juce::Slider::TextBoxBelow);
-    altoLevelSlider->setRange(0.0, 1.0, 0.01);
     altoLevelAttachment = std::make_unique<juce::AudioProcessorValueTreeState::SliderAttachment>(
         params, ChoirV2Processor::ALTO_LEVEL_PARAM, *altoLevelSlider);
     addAndMakeVisible(*altoLevelSlider);
@@ -339,7 +220,6 @@ ChoirV2Editor::ChoirV2Editor(ChoirV2Processor& p)
     addAndMakeVisible(*altoLevelLabel);
 
     tenorLevelSlider = std::make_unique<juce::Slider>(juce::Slider::LinearVertical, juce::Slider::TextBoxBelow);
-    tenorLevelSlider->setRange(0.0, 1.0, 0.01);
     tenorLevelAttachment = std::make_unique<juce::AudioProcessorValueTreeState::SliderAttachment>(
         params, ChoirV2Processor::TENOR_LEVEL_PARAM, *tenorLevelSlider);
     addAndMakeVisible(*tenorLevelSlider);
@@ -350,7 +230,6 @@ ChoirV2Editor::ChoirV2Editor(ChoirV2Processor& p)
     addAndMakeVisible(*tenorLevelLabel);
 
     bassLevelSlider = std::make_unique<juce::Slider>(juce::Slider::LinearVertical, juce::Slider::TextBoxBelow);
-    bassLevelSlider->setRange(0.0, 1.0, 0.01);
     bassLevelAttachment = std::make_unique<juce::AudioProcessorValueTreeState::SliderAttachment>(
         params, ChoirV2Processor::BASS_LEVEL_PARAM, *bassLevelSlider);
     addAndMakeVisible(*bassLevelSlider);
@@ -366,38 +245,14 @@ ChoirV2Editor::ChoirV2Editor(ChoirV2Processor& p)
     effectsGroup = std::make_unique<juce::GroupComponent>("EffectsGroup", "REVERB");
     addAndMakeVisible(*effectsGroup);
 
-    reverbMixSlider = std::make_unique<juce::Slider>(juce::Slider::RotaryHorizontalVerticalDrag, juce::Slider::TextBoxBelow);
-    reverbMixSlider->setRange(0.0, 1.0, 0.01);
-    reverbMixAttachment = std::make_unique<juce::AudioProcessorValueTreeState::SliderAttachment>(
-        params, ChoirV2Processor::REVERB_MIX_PARAM, *reverbMixSlider);
-    addAndMakeVisible(*reverbMixSlider);
-
-    reverbMixLabel = std::make_unique<juce::Label>("ReverbMixLabel", "Mix");
-    reverbMixLabel->attachToComponent(reverbMixSlider.get(), false);
-    reverbMixLabel->setJustification(juce::Justification::centred);
-    addAndMakeVisible(*reverbMixLabel);
-
-    reverbDecaySlider = std::make_unique<juce::Slider>(juce::Slider::RotaryHorizontalVerticalDrag, juce::Slider::TextBoxBelow);
-    reverbDecaySlider->setRange(0.1, 10.0, 0.1);
-    reverbDecayAttachment = std::make_unique<juce::AudioProcessorValueTreeState::SliderAttachment>(
-        params, ChoirV2Processor::REVERB_DECAY_PARAM, *reverbDecaySlider);
-    addAndMakeVisible(*reverbDecaySlider);
-
-    reverbDecayLabel = std::make_unique<juce::Label>("ReverbDecayLabel", "Decay");
-    reverbDecayLabel->attachToComponent(reverbDecaySlider.get(), false);
-    reverbDecayLabel->setJustification(juce::Justification::centred);
-    addAndMakeVisible(*reverbDecayLabel);
-
-    reverbPreDelaySlider = std::make_unique<juce::Slider>(juce::Slider::RotaryHorizontalVerticalDrag, juce::Slider::TextBoxBelow);
-    reverbPreDelaySlider->setRange(0.0, 0.1, 0.001);
-    reverbPreDelayAttachment = std::make_unique<juce::AudioProcessorValueTreeState::SliderAttachment>(
-        params, ChoirV2Processor::REVERB_PREDELAY_PARAM, *reverbPreDelaySlider);
-    addAndMakeVisible(*reverbPreDelaySlider);
-
-    reverbPreDelayLabel = std::make_unique<juce::Label>("ReverbPreDelayLabel", "Pre-Delay");
-    reverbPreDelayLabel->attachToComponent(reverbPreDelaySlider.get(), false);
-    reverbPreDelayLabel->setJustification(juce::Justification::centred);
-    addAndMakeVisible(*reverbPreDelayLabel);
+    setupRotarySlider(reverbMixSlider, reverbMixAttachment, reverbMixLabel, ChoirV2Processor::REVERB_MIX_PARAM,
+                      "ReverbMixLabel", "Mix");
+
+    setupRotarySlider(reverbDecaySlider, reverbDecayAttachment, reverbDecayLabel, ChoirV2Processor::REVERB_DECAY_PARAM,
+                      "ReverbDecayLabel", "Decay");
+
+    setupRotarySlider(reverbPreDelaySlider, reverbPreDelayAttachment, reverbPreDelayLabel, ChoirV2Processor::REVERB_PREDELAY_PARAM,
+                      "ReverbPreDelayLabel", "Pre-Delay");
 
     //==========================================================================
     // SPECTRAL
@@ -405,27 +260,11 @@ ChoirV2Editor::ChoirV2Editor(ChoirV2Processor& p)
     spectralGroup = std::make_unique<juce::GroupComponent>("SpectralGroup", "SPECTRAL");
     addAndMakeVisible(*spectralGroup);
 
-    spectralEnhanceSlider = std::make_unique<juce::Slider>(juce::Slider::RotaryHorizontalVerticalDrag, juce::Slider::TextBoxBelow);
-    spectralEnhanceSlider->setRange(0.0, 1.0, 0.01);
-    spectralEnhanceAttachment = std::make_unique<juce::AudioProcessorValueTreeState::SliderAttachment>(
-        params, ChoirV2Processor::SPECTRAL_ENHANCE_PARAM, *spectralEnhanceSlider);
-    addAndMakeVisible(*spectralEnhanceSlider);
-
-    spectralEnhanceLabel = std::make_unique<juce::Label>("SpectralEnhanceLabel", "Enhance");
-    spectralEnhanceLabel->attachToComponent(spectralEnhanceSlider.get(), false);
-    spectralEnhanceLabel->setJustification(juce::Justification::centred);
-    addAndMakeVisible(*spectralEnhanceLabel);
-
-    harmonicsBoostSlider = std::make_unique<juce::Slider>(juce::Slider::RotaryHorizontalVerticalDrag, juce::Slider::TextBoxBelow);
-    harmonicsBoostSlider->setRange(0.0, 1.0, 0.01);
-    harmonicsBoostAttachment = std::make_unique<juce::AudioProcessorValueTreeState::SliderAttachment>(
-        params, ChoirV2Processor::HARMONICS_BOOST_PARAM, *harmonicsBoostSlider);
-    addAndMakeVisible(*harmonicsBoostSlider);
+    setupRotarySlider(spectralEnhanceSlider, spectralEnhanceAttachment, spectralEnhanceLabel, ChoirV2Processor::SPECTRAL_ENHANCE_PARAM,
+                      "SpectralEnhanceLabel", "Enhance");
 
-    harmonicsBoostLabel = std::make_unique<juce::Label>("HarmonicsBoostLabel", "Harmonics");
-    harmonicsBoostLabel->attachToComponent(harmonicsBoostSlider.get(), false);
-    harmonicsBoostLabel->setJustification(juce::Justification::centred);
-    addAndMakeVisible(*harmonicsBoostLabel);
+    setupRotarySlider(harmonicsBoostSlider, harmonicsBoostAttachment, harmonicsBoostLabel, ChoirV2Processor::HARMONICS_BOOST_PARAM,
+                      "HarmonicsBoostLabel", "Harmonics");
 
     //==========================================================================
     // SUBHARMONIC
@@ -433,38 +272,14 @@ ChoirV2Editor::ChoirV2Editor(ChoirV2Processor& p)
     subharmonicGroup = std::make_unique<juce::GroupComponent>("SubharmonicGroup", "SUBHARMONIC");
     addAndMakeVisible(*subharmonicGroup);
 
-    subharmonicMixSlider = std::make_unique<juce::Slider>(juce::Slider::RotaryHorizontalVerticalDrag, juce::Slider::TextBoxBelow);
-    subharmonicMixSlider->setRange(0.0, 1.0, 0.01);
-    subharmonicMixAttachment = std::make_unique<juce::AudioProcessorValueTreeState::SliderAttachment>(
-        params, ChoirV2Processor::SUBHARMONIC_MIX_PARAM, *subharmonicMixSlider);
-    addAndMakeVisible(*subharmonicMixSlider);
-
-    subharmonicMixLabel = std::make_unique<juce::Label>("SubharmonicMixLabel", "Mix");
-    subharmonicMixLabel->attachToComponent(subharmonicMixSlider.get(), false);
-    subharmonicMixLabel->setJustification(juce::Justification::centred);
-    addAndMakeVisible(*subharmonicMixLabel);
-
-    subharmonicDepthSlider = std::make_unique<juce::Slider>(juce::Slider::RotaryHorizontalVerticalDrag, juce::Slider::TextBoxBelow);
-    subharmonicDepthSlider->setRange(0.0, 1.0, 0.01);
-    subharmonicDepthAttachment = std::make_unique<juce::AudioProcessorValueTreeState::SliderAttachment>(
-        params, ChoirV2Processor::SUBHARMONIC_DEPTH_PARAM, *subharmonicDepthSlider);
-    addAndMakeVisible(*subharmonicDepthSlider);
-
-    subharmonicDepthLabel = std::make_unique<juce::Label>("SubharmonicDepthLabel", "Depth");
-    subharmonicDepthLabel->attachToComponent(subharmonicDepthSlider.get(), false);
-    subharmonicDepthLabel->setJustification(juce::Justification::centred);
-    addAndMakeVisible(*subharmonicDepthLabel);
-
-    subharmonicRatioSlider = std::make_unique<juce::Slider>(juce::Slider::RotaryHorizontalVerticalDrag, juce::Slider::TextBoxBelow);
-    subharmonicRatioSlider->setRange(0.5, 2.0, 0.01);
-    subharmonicRatioAttachment = std::make_unique<juce::AudioProcessorValueTreeState::SliderAttachment>(
-        params, ChoirV2Processor::SUBHARMONIC_RATIO_PARAM, *subharmonicRatioSlider);
-    addAndMakeVisible(*subharmonicRatioSlider);
-
-    subharmonicRatioLabel = std::make_unique<juce::Label>("SubharmonicRatioLabel", "Ratio");
-    subharmonicRatioLabel->attachToComponent(subharmonicRatioSlider.get(), false);
-    subharmonicRatioLabel->setJustification(juce::Justification::centred);
-    addAndMakeVisible(*subharmonicRatioLabel);
+    setupRotarySlider(subharmonicMixSlider, subharmonicMixAttachment, subharmonicMixLabel, ChoirV2Processor::SUBHARMONIC_MIX_PARAM,
+                      "SubharmonicMixLabel", "Mix");
+
+    setupRotarySlider(subharmonicDepthSlider, subharmonicDepthAttachment, subharmonicDepthLabel, ChoirV2Processor::SUBHARMONIC_DEPTH_PARAM,
+                      "SubharmonicDepthLabel", "Depth");
+
+    setupRotarySlider(subharmonicRatioSlider, subharmonicRatioAttachment, subharmonicRatioLabel, ChoirV2Processor::SUBHARMONIC_RATIO_PARAM,
+                      "SubharmonicRatioLabel", "Ratio");
 
     //==========================================================================
     // DIPHONE
@@ -472,27 +287,11 @@ ChoirV2Editor::ChoirV2Editor(ChoirV2Processor& p)
     diphoneGroup = std::make_unique<juce::GroupComponent>("DiphoneGroup", "DIPHONE");
     addAndMakeVisible(*diphoneGroup);
 
-    crossfadeDurationSlider = std::make_unique<juce::Slider>(juce::Slider::RotaryHorizontalVerticalDrag, juce::Slider::TextBoxBelow);
-    crossfadeDurationSlider->setRange(0.01, 1.0, 0.01);
-    crossfadeDurationAttachment = std::make_unique<juce::AudioProcessorValueTreeState::SliderAttachment>(
-        params, ChoirV2Processor::CROSSFADE_DURATION_PARAM, *crossfadeDurationSlider);
-    addAndMakeVisible(*crossfadeDurationSlider);
-
-    crossfadeDurationLabel = std::make_unique<juce::Label>("CrossfadeDurationLabel", "Crossfade");
-    crossfadeDurationLabel->attachToComponent(crossfadeDurationSlider.get(), false);
-    crossfadeDurationLabel->setJustification(juce::Justification::centred);
-    addAndMakeVisible(*crossfadeDurationLabel);
-
-    formantSmoothingSlider = std::make_unique<juce::Slider>(juce::Slider::RotaryHorizontalVerticalDrag, juce::Slider::TextBoxBelow);
-    formantSmoothingSlider->setRange(0.0, 1.0, 0.01);
-    formantSmoothingAttachment = std::make_unique<juce::AudioProcessorValueTreeState::SliderAttachment>(
-        params, ChoirV2Processor::FORMANT_SMOOTHING_PARAM, *formantSmoothingSlider);
-    addAndMakeVisible(*formantSmoothingSlider);
+    setupRotarySlider(crossfadeDurationSlider, crossfadeDurationAttachment, crossfadeDurationLabel, ChoirV2Processor::CROSSFADE_DURATION_PARAM,
+                      "CrossfadeDurationLabel", "Crossfade");
 
-    formantSmoothingLabel = std::make_unique<juce::Label>("FormantSmoothingLabel", "Smoothing");
-    formantSmoothingLabel->attachToComponent(formantSmoothingSlider.get(), false);
-    formantSmoothingLabel->setJustification(juce::Justification::centred);
-    addAndMakeVisible(*formantSmoothingLabel);
+    setupRotarySlider(formantSmoothingSlider, formantSmoothingAttachment, formantSmoothingLabel, ChoirV2Processor::FORMANT_SMOOTHING_PARAM,
+                      "FormantSmoothingLabel", "Smoothing");
 
     //==========================================================================
     // SYNTHESIS METHOD
@@ -542,6 +341,24 @@ ChoirV2Editor::~ChoirV2Editor()
     setLookAndFeel(nullptr);
 }
 
+void ChoirV2Editor::setupRotarySlider(std::unique_ptr<juce::Slider>& slider,
+                                      std::unique_ptr<juce::AudioProcessorValueTreeState::SliderAttachment>& attachment,
+                                      std::unique_ptr<juce::Label>& label,
+                                      const juce::String& parameterID,
+                                      const juce::String& labelName, const juce::String& labelText)
+{
+    // Range and step come from the parameter via the attachment
+    slider = std::make_unique<juce::Slider>(juce::Slider::RotaryHorizontalVerticalDrag, juce::Slider::TextBoxBelow);
+    attachment = std::make_unique<juce::AudioProcessorValueTreeState::SliderAttachment>(
+        processorRef.getParameterTree(), parameterID, *slider);
+    addAndMakeVisible(*slider);
+
+    label = std::make_unique<juce::Label>(labelName, labelText);
+    label->attachToComponent(slider.get(), false);
+    label->setJustification(juce::Justification::centred);
+    addAndMakeVisible(*label);
+}
+
 //==============================================================================
 void ChoirV2Editor::paint(juce::Graphics& g)
 {
@@ -549,12 +366,12 @@ void ChoirV2Editor::paint(juce::Graphics& g)
     g.fillAll(getLookAndFeel().findColour(juce::ResizableWindow::backgroundColourId));
 
     // Title
-    g.setColour(juce::Colour(220, 220, 220));
-    g.setFont(juce::Font(32.0f, juce::Font::bold));
+    g.setColour(Palette::text);
+    g.setFont(titleFont);
     g.drawText("Choir V2", getLocalBounds().removeFromTop(40), juce::Justification::centred, true);
 
     // Subtitle
-    g.setFont(juce::Font(14.0f));
+    g.setFont(subtitleFont);
     g.drawText("Choral Synthesis Instrument", getLocalBounds().removeFromTop(60), juce::Justification::centred, true);
 }
 
@@ -1,6 +1,16 @@
 #include "plugin/ChoirV2Processor.h"
 #include "plugin/ChoirV2Editor.h"
 
+//==============================================================================
+namespace StateIDs
+{
+    // Interned once here instead of looked up from literals on every save/load
+    const juce::Identifier state ("ChoirV2State");
+    const juce::Identifier parameters ("parameters"); // Legacy sessions only
+    const juce::Identifier preset ("preset");
+    const juce::Identifier version ("version");
+}
+
 //==============================================================================
 ChoirV2Processor::ChoirV2Processor()
 #ifndef JucePlugin_PreferredChannelConfigurations
@@ -16,25 +26,30 @@ ChoirV2Processor::ChoirV2Processor()
                  createParameterLayout())
 #endif
 {
-    // Initialize PureDSP engine with default parameters
-    pureDSP_.prepare(44100.0, 512);
+    // PureDSP voices are allocated in prepareToPlay() once the host supplies
+    // the real sample rate and block size, not here at construction
+
+    // Resolve each parameter's PureDSP slot once, so parameter callbacks
+    // (which can arrive on the audio thread) never search by ID
+    const auto& params = getParameters();
+    dspParameterSlots.reserve((size_t) params.size());
 
-    // Listen to all parameter changes
-    auto& params = parameters;
     for (auto* param : params)
     {
+        auto* paramWithID = dynamic_cast<juce::AudioProcessorParameterWithID*>(param);
+        dspParameterSlots.push_back(paramWithID != nullptr
+                                        ? DSP::ChoirV2PureDSP::getParameterIndex(paramWithID->paramID)
+                                        : -1);
+
+        // Listen to all parameter changes
         param->addListener(this);
     }
-
-    // Start timer for UI updates (30Hz)
-    startTimerHz(30);
 }
 
 ChoirV2Processor::~ChoirV2Processor()
 {
     // Remove parameter listeners
-    auto& params = parameters;
-    for (auto* param : params)
+    for (auto* param : getParameters())
     {
         param->removeListener(this);
     }
@@ -74,6 +89,9 @@ void ChoirV2Processor::processBlock(juce::AudioBuffer<float>& buffer,
 void ChoirV2Processor::processMidiEvents(juce::AudioBuffer<float>& buffer,
                                         const juce::MidiBuffer& midiMessages)
 {
+    // 7-bit MIDI values are scaled by a precomputed reciprocal, not divided per event
+    constexpr float midiValueScale = 1.0f / 127.0f;
+
     // Convert MIDI messages to PureDSP ScheduledEvents
     for (const auto metadata : midiMessages)
     {
@@ -87,7 +105,7 @@ void ChoirV2Processor::processMidiEvents(juce::AudioBuffer<float>& buffer,
         {
             event.type = DSP::ChoirV2PureDSP::ScheduledEvent::NoteOn;
             event.noteNumber = message.getNoteNumber();
-            event.velocity = message.getVelocity() / 127.0f;
+            event.velocity = message.getVelocity() * midiValueScale;
             pureDSP_.handleEvent(event);
         }
         else if (message.isNoteOff())
@@ -105,7 +123,7 @@ void ChoirV2Processor::processMidiEvents(juce::AudioBuffer<float>& buffer,
         else if (message.isAftertouch())
         {
             event.type = DSP::ChoirV2PureDSP::ScheduledEvent::Aftertouch;
-            event.aftertouchValue = message.getAfterTouchValue() / 127.0f;
+            event.aftertouchValue = message.getAfterTouchValue() * midiValueScale;
             pureDSP_.handleEvent(event);
         }
     }
@@ -124,16 +142,17 @@ void ChoirV2Processor::getStateInformation(juce::MemoryBlock& destData)
     juce::String presetJson = pureDSP_.savePreset();
 
     // Create state object
-    juce::ValueTree state("ChoirV2State");
+    juce::ValueTree state(StateIDs::state);
 
-    // Store parameters
-    state.setProperty("parameters", parameters.copyState().toXmlString(), nullptr);
+    // Store parameters as a child tree, so the whole state is written as a
+    // single XML document instead of an escaped XML string nested inside it
+    state.appendChild(parameters.copyState(), nullptr);
 
     // Store PureDSP preset
-    state.setProperty("preset", presetJson, nullptr);
+    state.setProperty(StateIDs::preset, presetJson, nullptr);
 
     // Store version
-    state.setProperty("version", "1.0.0", nullptr);
+    state.setProperty(StateIDs::version, "1.0.0", nullptr);
 
     // Convert to XML and save
     auto xml = state.createXml();
@@ -150,236 +169,155 @@ void ChoirV2Processor::setStateInformation(const void* data, int sizeInBytes)
         juce::ValueTree state = juce::ValueTree::fromXml(*xml);
 
         // Restore parameters
-        if (state.hasProperty("parameters"))
+        auto paramState = state.getChildWithName(parameters.state.getType());
+        if (paramState.isValid())
         {
-            auto paramXml = xml->getChildElement(0);
-            if (paramXml != nullptr)
-            {
+            parameters.replaceState(paramState.createCopy());
+        }
+        else if (state.hasProperty(StateIDs::parameters))
+        {
+            // Older sessions stored the parameters as an XML string property
+            if (auto paramXml = juce::parseXML(state.getProperty(StateIDs::parameters).toString()))
                 parameters.replaceState(juce::ValueTree::fromXml(*paramXml));
-            }
         }
 
-        // Restore PureDSP preset
-        if (state.hasProperty("preset"))
+        // Restore PureDSP preset (one lookup for both the check and the read)
+        if (auto* presetJson = state.getPropertyPointer(StateIDs::preset))
         {
-            juce::String presetJson = state.getProperty("preset").toString();
-            pureDSP_.loadPreset(presetJson);
+            pureDSP_.loadPreset(presetJson->toString());
         }
     }
 }
 
 //==============================================================================
-void ChoirV2Processor::parameterChanged(const juce::String& parameterID,
-                                       float newValue)
+void ChoirV2Processor::parameterValueChanged(int parameterIndex, float newValue)
 {
-    // Forward parameter changes to PureDSP
-    pureDSP_.setParameter(parameterID, newValue);
-}
+    const int slot = dspParameterSlots[(size_t) parameterIndex];
+    if (slot < 0)
+        return;
 
-//==============================================================================
-void ChoirV2Processor::timerCallback()
-{
-    // Trigger async updates for editor
-    // This is useful for updating visualizations like:
-    // - Active note count
-    // - Waveform displays
-    // - Spectrum analyzers
-    // - VU meters
+    // Listeners receive normalised values; PureDSP stores real units.
+    // Every parameter with a PureDSP slot is a RangedAudioParameter.
+    auto* param = static_cast<juce::RangedAudioParameter*>(getParameters()[parameterIndex]);
+
+    // Forward parameter changes to PureDSP
+    pureDSP_.setParameterAtIndex(slot, param->convertFrom0to1(newValue));
 }
 
 //==============================================================================
 juce::AudioProcessorValueTreeState::ParameterLayout
 ChoirV2Processor::createParameterLayout()
 {
-    std::vector<std::unique_ptr<juce::RangedAudioParameter>> params;
+    // Parameters are added straight to the layout, with no intermediate list
+    juce::AudioProcessorValueTreeState::ParameterLayout layout;
 
-    // Helper macro for creating parameters
-    auto makeParam = [](const char* id, const char* name,
-                       float min, float max, float def,
-                       const char* label = "")
+    using ID = DSP::ChoirV2PureDSP::ParameterID;
+
+    // Float parameters are described by table rows; defaults, ranges and steps
+    // come from the PureDSP engine so they are defined only once
+    struct FloatParameterSpec
+    {
+        const char* id;
+        const char* name;
+        const char* label;
+    };
+
+    static constexpr FloatParameterSpec masterParams[] = {
+        { ID::masterVolume, "Master Volume", "" },
+        { ID::polyphony,    "Polyphony",     "" },
+    };
+
+    static constexpr FloatParameterSpec voiceParams[] = {
+        // Vowel space navigation (3D)
+        { ID::vowelX,                   "Vowel X",              "" },
+        { ID::vowelY,                   "Vowel Y",              "" },
+        { ID::vowelZ,                   "Vowel Z",              "" },
+
+        // Formant controls
+        { ID::formantScale,             "Formant Scale",        "" },
+        { ID::formantShift,             "Formant Shift",        "" },
+
+        // Breath and air
+        { ID::breathMix,                "Breath Mix",           "" },
+        { ID::breathColor,              "Breath Color",         "" },
+
+        // Vibrato
+        { ID::vibratoRate,              "Vibrato Rate",         "Hz" },
+        { ID::vibratoDepth,             "Vibrato Depth",        "" },
+        { ID::vibratoDelay,             "Vibrato Delay",        "s" },
+
+        // Ensemble
+        { ID::tightness,                "Tightness",            "" },
+        { ID::ensembleSize,             "Ensemble Size",        "" },
+        { ID::voiceSpread,              "Voice Spread",         "" },
+
+        // ADSR envelope
+        { ID::attack,                   "Attack",               "s" },
+        { ID::decay,                    "Decay",                "s" },
+        { ID::sustain,                  "Sustain",              "" },
+        { ID::release,                  "Release",              "s" },
+
+        // Section levels
+        { ID::sopranoLevel,             "Soprano Level",        "" },
+        { ID::altoLevel,                "Alto Level",           "" },
+        { ID::tenorLevel,               "Tenor Level",          "" },
+        { ID::bassLevel,                "Bass Level",           "" },
+
+        // Reverb
+        { ID::reverbMix,                "Reverb Mix",           "" },
+        { ID::reverbDecay,              "Reverb Decay",         "s" },
+        { ID::reverbPredelay,           "Reverb Predelay",      "s" },
+
+        // Enhancement
+        { ID::spectralEnhancement,      "Spectral Enhancement", "" },
+        { ID::harmonicsBoost,           "Harmonics Boost",      "" },
+
+        // Subharmonic
+        { ID::subharmonicMix,           "Subharmonic Mix",      "" },
+        { ID::subharmonicDepth,         "Subharmonic Depth",    "" },
+        { ID::subharmonicRatio,         "Subharmonic Ratio",    "" },
+
+        // Diphone system
+        { ID::diphoneCrossfadeDuration, "Diphone Crossfade",    "s" },
+        { ID::diphoneFormantSmoothing,  "Formant Smoothing",    "" },
+    };
+
+    auto makeParam = [](const FloatParameterSpec& spec)
     -> std::unique_ptr<juce::AudioParameterFloat>
     {
         return std::make_unique<juce::AudioParameterFloat>(
-            juce::ParameterID(id, 1),
-            name,
-            juce::NormalisableRange<float>(min, max),
-            def,
+            juce::ParameterID(spec.id, 1),
+            spec.name,
+            DSP::ChoirV2PureDSP::getParameterRange(spec.id),
+            DSP::ChoirV2PureDSP::getDefaultParameter(spec.id),
             juce::AudioParameterFloatAttributes()
-                .withLabel(label)
+                .withLabel(spec.label)
                 .withCategory(juce::AudioParameterFloat::Category::genericParameter)
         );
     };
 
     // Master
-    params.push_back(makeParam(
-        DSP::ChoirV2PureDSP::ParameterID::masterVolume,
-        "Master Volume", 0.0f, 1.0f, 0.8f
-    ));
-    params.push_back(makeParam(
-        DSP::ChoirV2PureDSP::ParameterID::polyphony,
-        "Polyphony", 1.0f, 64.0f, 32.0f
-    ));
+    for (const auto& spec : masterParams)
+        layout.add(makeParam(spec));
 
     // Text input (string parameter)
-    params.push_back(std::make_unique<juce::AudioParameterString>(
-        juce::ParameterID(DSP::ChoirV2PureDSP::ParameterID::textInput, 1),
+    layout.add(std::make_unique<juce::AudioParameterString>(
+        juce::ParameterID(ID::textInput, 1),
         "Text Input",
         ""
     ));
 
     // Phoneme display (read-only)
-    params.push_back(std::make_unique<juce::AudioParameterString>(
-        juce::ParameterID(DSP::ChoirV2PureDSP::ParameterID::phonemeDisplay, 1),
+    layout.add(std::make_unique<juce::AudioParameterString>(
+        juce::ParameterID(ID::phonemeDisplay, 1),
         "Phoneme Display",
         "",
         juce::AudioParameterStringAttributes().withAutomatable(false)
     ));
 
-    // Vowel space navigation (3D)
-    params.push_back(makeParam(
-        DSP::ChoirV2PureDSP::ParameterID::vowelX,
-        "Vowel X", -1.0f, 1.0f, 0.0f
-    ));
-    params.push_back(makeParam(
-        DSP::ChoirV2PureDSP::ParameterID::vowelY,
-        "Vowel Y", -1.0f, 1.0f, 0.0f
-    ));
-    params.push_back(makeParam(
-        DSP::ChoirV2PureDSP::ParameterID::vowelZ,
-        "Vowel Z", -1.0f, 1.0f, 0.0f
-    ));
-
-    // Formant controls
-    params.push_back(makeParam(
-        DSP::ChoirV2PureDSP::ParameterID::formantScale,
-        "Formant Scale", 0.5f, 2.0f, 1.0f
-    ));
-    params.push_back(makeParam(
-        DSP::ChoirV2PureDSP::ParameterID::formantShift,
-        "Formant Shift", -12.0f, 12.0f, 0.0f
-    ));
-
-    // Breath and air
-    params.push_back(makeParam(
-        DSP::ChoirV2PureDSP::ParameterID::breathMix,
-        "Breath Mix", 0.0f, 1.0f, 0.0f
-    ));
-    params.push_back(makeParam(
-        DSP::ChoirV2PureDSP::ParameterID::breathColor,
-        "Breath Color", 0.0f, 1.0f, 0.5f
-    ));
-
-    // Vibrato
-    params.push_back(makeParam(
-        DSP::ChoirV2PureDSP::ParameterID::vibratoRate,
-        "Vibrato Rate", 0.0f, 15.0f, 5.0f, "Hz"
-    ));
-    params.push_back(makeParam(
-        DSP::ChoirV2PureDSP::ParameterID::vibratoDepth,
-        "Vibrato Depth", 0.0f, 1.0f, 0.1f
-    ));
-    params.push_back(makeParam(
-        DSP::ChoirV2PureDSP::ParameterID::vibratoDelay,
-        "Vibrato Delay", 0.0f, 2.0f, 0.5f, "s"
-    ));
-
-    // Ensemble
-    params.push_back(makeParam(
-        DSP::ChoirV2PureDSP::ParameterID::tightness,
-        "Tightness", 0.0f, 1.0f, 0.5f
-    ));
-    params.push_back(makeParam(
-        DSP::ChoirV2PureDSP::ParameterID::ensembleSize,
-        "Ensemble Size", 1.0f, 100.0f, 32.0f
-    ));
-    params.push_back(makeParam(
-        DSP::ChoirV2PureDSP::ParameterID::voiceSpread,
-        "Voice Spread", 0.0f, 1.0f, 0.3f
-    ));
-
-    // ADSR envelope
-    params.push_back(makeParam(
-        DSP::ChoirV2PureDSP::ParameterID::attack,
-        "Attack", 0.001f, 2.0f, 0.05f, "s"
-    ));
-    params.push_back(makeParam(
-        DSP::ChoirV2PureDSP::ParameterID::decay,
-        "Decay", 0.001f, 2.0f, 0.2f, "s"
-    ));
-    params.push_back(makeParam(
-        DSP::ChoirV2PureDSP::ParameterID::sustain,
-        "Sustain", 0.0f, 1.0f, 0.7f
-    ));
-    params.push_back(makeParam(
-        DSP::ChoirV2PureDSP::ParameterID::release,
-        "Release", 0.01f, 5.0f, 0.3f, "s"
-    ));
-
-    // Section levels
-    params.push_back(makeParam(
-        DSP::ChoirV2PureDSP::ParameterID::sopranoLevel,
-        "Soprano Level", 0.0f, 1.0f, 0.8f
-    ));
-    params.push_back(makeParam(
-        DSP::ChoirV2PureDSP::ParameterID::altoLevel,
-        "Alto Level", 0.0f, 1.0f, 0.8f
-    ));
-    params.push_back(makeParam(
-        DSP::ChoirV2PureDSP::ParameterID::tenorLevel,
-        "Tenor Level", 0.0f, 1.0f, 0.8f
-    ));
-    params.push_back(makeParam(
-        DSP::ChoirV2PureDSP::ParameterID::bassLevel,
-        "Bass Level", 0.0f, 1.0f, 0.8f
-    ));
-
-    // Reverb
-    params.push_back(makeParam(
-        DSP::ChoirV2PureDSP::ParameterID::reverbMix,
-        "Reverb Mix", 0.0f, 1.0f, 0.3f
-    ));
-    params.push_back(makeParam(
-        DSP::ChoirV2PureDSP::ParameterID::reverbDecay,
-        "Reverb Decay", 0.1f, 10.0f, 2.5f, "s"
-    ));
-    params.push_back(makeParam(
-        DSP::ChoirV2PureDSP::ParameterID::reverbPredelay,
-        "Reverb Predelay", 0.0f, 0.1f, 0.02f, "s"
-    ));
-
-    // Enhancement
-    params.push_back(makeParam(
-        DSP::ChoirV2PureDSP::ParameterID::spectralEnhancement,
-        "Spectral Enhancement", 0.0f, 1.0f, 0.5f
-    ));
-    params.push_back(makeParam(
-        DSP::ChoirV2PureDSP::ParameterID::harmonicsBoost,
-        "Harmonics Boost", 0.0f, 1.0f, 0.3f
-    ));
-
-    // Subharmonic
-    params.push_back(makeParam(
-        DSP::ChoirV2PureDSP::ParameterID::subharmonicMix,
-        "Subharmonic Mix", 0.0f, 1.0f, 0.0f
-    ));
-    params.push_back(makeParam(
-        DSP::ChoirV2PureDSP::ParameterID::subharmonicDepth,
-        "Subharmonic Depth", 0.0f, 1.0f, 0.5f
-    ));
-    params.push_back(makeParam(
-        DSP::ChoirV2PureDSP::ParameterID::subharmonicRatio,
-        "Subharmonic Ratio", 0.5f, 2.0f, 1.0f
-    ));
-
-    // Diphone system
-    params.push_back(makeParam(
-        DSP::ChoirV2PureDSP::ParameterID::diphoneCrossfadeDuration,
-        "Diphone Crossfade", 0.01f, 0.5f, 0.1f, "s"
-    ));
-    params.push_back(makeParam(
-        DSP::ChoirV2PureDSP::ParameterID::diphoneFormantSmoothing,
-        "Formant Smoothing", 0.0f, 1.0f, 0.5f
-    ));
+    // Vowel, formant, voice, ensemble and effect controls
+    for (const auto& spec : voiceParams)
+        layout.add(makeParam(spec));
 
     // Synthesis method (choice parameter)
     auto synthesisChoices = juce::StringArray{
@@ -389,14 +327,14 @@ ChoirV2Processor::createParameterLayout()
         "Hybrid"
     };
 
-    params.push_back(std::make_unique<juce::AudioParameterChoice>(
-        juce::ParameterID(DSP::ChoirV2PureDSP::ParameterID::synthesisMethod, 1),
+    layout.add(std::make_unique<juce::AudioParameterChoice>(
+        juce::ParameterID(ID::synthesisMethod, 1),
         "Synthesis Method",
         synthesisChoices,
         0
     ));
 
-    return { params.begin(), params.end() };
+    return layout;
 }
 
 //==============================================================================